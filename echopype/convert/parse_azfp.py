@@ -1,11 +1,13 @@
 import os
-import xml.dom.minidom
+import xml.etree.ElementTree as ET
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime as dt
-from struct import unpack
+from functools import lru_cache, partial
 
 import fsspec
 import numpy as np
+from fsspec.implementations.local import LocalFileSystem
 
 from ..utils.log import _init_logger
 from .parse_base import ParseBase
@@ -98,18 +100,81 @@ HEADER_FIELDS = (
     ("ancillary", "u2", 5),  # Tilt-X, Y, Battery, Pressure, Temperature
     ("ad", "u2", 2),  # AD channel 6 and 7
 )
+# Big-endian structured dtype mirroring HEADER_FIELDS,
+# used to parse all ping headers in a single C-level pass
+HEADER_DTYPE = np.dtype(
+    [
+        (field[0], ">" + field[1], field[2]) if len(field) == 3 else (field[0], ">" + field[1])
+        for field in HEADER_FIELDS
+    ]
+)
+# fields with num_freq data
+FIELD_W_FREQ = (
+    "dig_rate",
+    "lockout_index",
+    "num_bins",
+    "range_samples_per_bin",
+    "data_type",
+    "gain",
+    "pulse_length",
+    "board_num",
+    "frequency",
+)
+# Field dispatch precomputed once at import time: each header column is either
+# sliced to num_freq channels or taken whole (scalars, 'ancillary' and 'ad')
+HEADER_FIELD_PLAN = tuple((field[0], field[0] in FIELD_W_FREQ) for field in HEADER_FIELDS)
 
 logger = _init_logger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _load_xml_parameters(xml_path, storage_options_items):
+    """Parse an AZFP XML parameter file into a parameter dict.
+
+    All raw files of a deployment typically point at the same XML file,
+    so results are cached on ``(xml_path, storage_options)`` and the
+    file is opened and parsed only once per run.
+    """
+    xmlmap = fsspec.get_mapper(xml_path, **dict(storage_options_items))
+    tree = ET.parse(xmlmap.fs.open(xmlmap.root))
+
+    # Map tag name to all text values with that tag, in document order,
+    # so each lookup below is a dict access instead of a full DOM search
+    tag2text = defaultdict(list)
+    for element in tree.iter():
+        tag2text[element.tag].append(element.text)
+
+    def get_value_by_tag_name(tag_name, element=0):
+        """Returns the value in an XML tag given the tag name and the number of occurrences."""
+        return tag2text[tag_name][element]
+
+    parameters = dict()
+    # Retrieve integer parameters from the xml file
+    for old_name, new_name in XML_INT_PARAMS.items():
+        parameters[new_name] = int(get_value_by_tag_name(old_name))
+    # Retrieve floating point parameters from the xml file
+    for param in XML_FLOAT_PARAMS:
+        parameters[param] = float(get_value_by_tag_name(param))
+    # Retrieve frequency dependent parameters from the xml file
+    for old_name, new_name in XML_FREQ_PARAMS.items():
+        parameters[new_name] = [
+            float(get_value_by_tag_name(old_name, ch)) for ch in range(parameters["num_freq"])
+        ]
+    return parameters
+
+
 class ParseAZFP(ParseBase):
     """Class for converting data from ASL Environmental Sciences AZFP echosounder."""
 
     # Instrument specific constants
     HEADER_SIZE = 124
-    HEADER_FORMAT = ">HHHHIHHHHHHHHHHHHHHHHHHHHHHHHHHHHHBBBBHBBBBBBBBHHHHHHHHHHHHHHHHHHHH"
     FILE_TYPE = 64770
 
+    # Sv calculation compensation factor, keyed on pulse length in us,
+    # for frequencies above and up to 38 kHz
+    SV_OFFSET_HIGH_FREQ = {300: 1.1, 500: 0.8, 700: 0.5, 900: 0.3, 1000: 0.3}
+    SV_OFFSET_LOW_FREQ = {500: 1.1, 1000: 0.7}
+
     def __init__(self, file, params, storage_options={}, dgram_zarr_vars={}):
         super().__init__(file, storage_options)
         # Parent class attributes
@@ -119,102 +184,92 @@ class ParseAZFP(ParseBase):
 
         # Class attributes
         self.parameters = dict()
-        self.unpacked_data = defaultdict(list)
+        self.unpacked_data = dict()
         self.sonar_type = "AZFP"
 
     def load_AZFP_xml(self):
         """Parse XML file to get params for reading AZFP data."""
-        """Parses the AZFP  XML file.
-        """
+        try:
+            parameters = _load_xml_parameters(
+                self.xml_path, tuple(sorted(self.storage_options.items()))
+            )
+        except TypeError:
+            # storage options with unhashable values cannot key the cache
+            parameters = _load_xml_parameters.__wrapped__(
+                self.xml_path, tuple(self.storage_options.items())
+            )
+        # shallow copy: parse_raw rebinds list values to per-instance arrays
+        self.parameters.update(parameters)
 
-        def get_value_by_tag_name(tag_name, element=0):
-            """Returns the value in an XML tag given the tag name and the number of occurrences."""
-            return px.getElementsByTagName(tag_name)[element].childNodes[0].data
-
-        xmlmap = fsspec.get_mapper(self.xml_path, **self.storage_options)
-        px = xml.dom.minidom.parse(xmlmap.fs.open(xmlmap.root))
-
-        # Retrieve integer parameters from the xml file
-        for old_name, new_name in XML_INT_PARAMS.items():
-            self.parameters[new_name] = int(get_value_by_tag_name(old_name))
-        # Retrieve floating point parameters from the xml file
-        for param in XML_FLOAT_PARAMS:
-            self.parameters[param] = float(get_value_by_tag_name(param))
-        # Retrieve frequency dependent parameters from the xml file
-        for old_name, new_name in XML_FREQ_PARAMS.items():
-            self.parameters[new_name] = [
-                float(get_value_by_tag_name(old_name, ch))
-                for ch in range(self.parameters["num_freq"])
-            ]
-
-    def _compute_temperature(self, ping_num, is_valid):
+    def _compute_temperature(self, is_valid):
         """
-        Compute temperature in celsius.
+        Compute temperature in celsius for all pings.
 
         Parameters
         ----------
-        ping_num
-            ping number
         is_valid
-            whether the associated parameters have valid values
+            whether the associated parameters have valid values;
+            when False the whole column is NaN-filled without
+            evaluating the conversion
         """
+        counts = self.unpacked_data["ancillary"][:, 4]
         if not is_valid:
-            return np.nan
+            return np.full(counts.shape, np.nan)
 
-        counts = self.unpacked_data["ancillary"][ping_num][4]
         v_in = 2.5 * (counts / 65535)
         R = (self.parameters["ka"] + self.parameters["kb"] * v_in) / (self.parameters["kc"] - v_in)
 
         # fmt: off
+        ln_R = np.log(R)  # computed once, used in both Steinhart-Hart terms
         T = 1 / (
             self.parameters["A"]
-            + self.parameters["B"] * (np.log(R))
-            + self.parameters["C"] * (np.log(R) ** 3)
+            + self.parameters["B"] * ln_R
+            + self.parameters["C"] * (ln_R ** 3)
         ) - 273
         # fmt: on
         return T
 
-    def _compute_tilt(self, ping_num, xy, is_valid):
+    def _compute_tilt(self, xy, is_valid):
         """
-        Compute instrument tilt.
+        Compute instrument tilt for all pings.
 
         Parameters
         ----------
-        ping_num
-            ping number
         xy
             either "X" or "Y"
         is_valid
-            whether the associated parameters have valid values
+            whether the associated parameters have valid values;
+            when False the whole column is NaN-filled without
+            evaluating the polynomial
         """
+        idx = 0 if xy == "X" else 1
+        N = self.unpacked_data["ancillary"][:, idx]
         if not is_valid:
-            return np.nan
+            return np.full(N.shape, np.nan)
         else:
-            idx = 0 if xy == "X" else 1
-            N = self.unpacked_data["ancillary"][ping_num][idx]
             a = self.parameters[f"{xy}_a"]
             b = self.parameters[f"{xy}_b"]
             c = self.parameters[f"{xy}_c"]
             d = self.parameters[f"{xy}_d"]
-            return a + b * N + c * N**2 + d * N**3
+            # a + b*N + c*N**2 + d*N**3 evaluated via Horner's method,
+            # avoiding the intermediate power arrays
+            return ((d * N + c) * N + b) * N + a
 
-    def _compute_battery(self, ping_num, battery_type):
+    def _compute_battery(self, battery_type):
         """
-        Compute battery voltage.
+        Compute battery voltage for all pings.
 
         Parameters
         ----------
-        ping_num
-            ping number
         type
             either "main" or "tx"
         """
         USL5_BAT_CONSTANT = (2.5 / 65536.0) * (86.6 + 475.0) / 86.6
 
         if battery_type == "main":
-            N = self.unpacked_data["ancillary"][ping_num][2]
+            N = self.unpacked_data["ancillary"][:, 2]
         elif battery_type == "tx":
-            N = self.unpacked_data["ad"][ping_num][0]
+            N = self.unpacked_data["ad"][:, 0]
 
         return N * USL5_BAT_CONSTANT
 
@@ -238,72 +293,46 @@ class ParseAZFP(ParseBase):
         tilt_x_is_valid = _test_valid_params(["X_a", "X_b", "X_c"])
         tilt_y_is_valid = _test_valid_params(["Y_a", "Y_b", "Y_c"])
 
-        with fmap.fs.open(fmap.root, "rb") as file:
-            ping_num = 0
-            eof = False
-            while not eof:
-                header_chunk = file.read(self.HEADER_SIZE)
-                if header_chunk:
-                    header_unpacked = unpack(self.HEADER_FORMAT, header_chunk)
-
-                    # Reading will stop if the file contains an unexpected flag
-                    if self._split_header(file, header_unpacked):
-                        # Appends the actual 'data values' to unpacked_data
-                        self._add_counts(file, ping_num)
-                        if ping_num == 0:
-                            # Display information about the file that was loaded in
-                            self._print_status()
-                        # Compute temperature from unpacked_data[ii]['ancillary][4]
-                        self.unpacked_data["temperature"].append(
-                            self._compute_temperature(ping_num, temperature_is_valid)
-                        )
-                        # compute x tilt from unpacked_data[ii]['ancillary][0]
-                        self.unpacked_data["tilt_x"].append(
-                            self._compute_tilt(ping_num, "X", tilt_x_is_valid)
-                        )
-                        # Compute y tilt from unpacked_data[ii]['ancillary][1]
-                        self.unpacked_data["tilt_y"].append(
-                            self._compute_tilt(ping_num, "Y", tilt_y_is_valid)
-                        )
-                        # Compute cos tilt magnitude from tilt x and y values
-                        self.unpacked_data["cos_tilt_mag"].append(
-                            np.cos(
-                                (
-                                    np.sqrt(
-                                        self.unpacked_data["tilt_x"][ping_num] ** 2
-                                        + self.unpacked_data["tilt_y"][ping_num] ** 2
-                                    )
-                                )
-                                * np.pi
-                                / 180
-                            )
-                        )
-                        # Calculate voltage of main battery pack
-                        self.unpacked_data["battery_main"].append(
-                            self._compute_battery(ping_num, battery_type="main")
-                        )
-                        # If there is a Tx battery pack
-                        self.unpacked_data["battery_tx"].append(
-                            self._compute_battery(ping_num, battery_type="tx")
-                        )
-                    else:
-                        break
-                else:
-                    # End of file
-                    eof = True
-                ping_num += 1
+        if isinstance(fmap.fs, LocalFileSystem):
+            # Memory-map local files so header and payload views are
+            # zero-copy and served from the OS page cache
+            raw = np.memmap(fmap.root, dtype=np.uint8, mode="r")
+        else:
+            # Read remote files in a single sequential pass: one request
+            # instead of a 124-byte read per ping header
+            with fmap.fs.open(fmap.root, "rb") as file:
+                raw = file.read()
+
+        num_pings = self._split_headers(raw)
+        if num_pings == 0:
+            return
+
+        # Display information about the file that was loaded in
+        self._print_status()
+
+        # Adds the actual 'data values' to unpacked_data, all pings at once
+        self._add_counts(raw, num_pings)
+
+        # Compute temperature from unpacked_data[ii]['ancillary][4]
+        self.unpacked_data["temperature"] = self._compute_temperature(temperature_is_valid)
+        # compute x tilt from unpacked_data[ii]['ancillary][0]
+        self.unpacked_data["tilt_x"] = self._compute_tilt("X", tilt_x_is_valid)
+        # Compute y tilt from unpacked_data[ii]['ancillary][1]
+        self.unpacked_data["tilt_y"] = self._compute_tilt("Y", tilt_y_is_valid)
+        # Compute cos tilt magnitude from tilt x and y values
+        self.unpacked_data["cos_tilt_mag"] = np.cos(
+            np.deg2rad(np.hypot(self.unpacked_data["tilt_x"], self.unpacked_data["tilt_y"]))
+        )
+        # Calculate voltage of main battery pack
+        self.unpacked_data["battery_main"] = self._compute_battery(battery_type="main")
+        # If there is a Tx battery pack
+        self.unpacked_data["battery_tx"] = self._compute_battery(battery_type="tx")
         self._check_uniqueness()
         self._get_ping_time()
 
         # Explicitly cast frequency to a float in accordance with the SONAR-netCDF4 convention
         self.unpacked_data["frequency"] = self.unpacked_data["frequency"].astype(np.float64)
 
-        # cast unpacked_data values to np arrays, so they are easier to reference
-        for key, val in self.unpacked_data.items():
-            # if it is not a nested list, make the value into a ndarray
-            if isinstance(val, list) and (not isinstance(val[0], list)):
-                self.unpacked_data[key] = np.asarray(val)
-
         # cast all list parameter values to np array, so they are easier to reference
         for key, val in self.parameters.items():
             if isinstance(val, list):
@@ -324,108 +353,128 @@ class ParseAZFP(ParseBase):
         pathstr, xml_name = os.path.split(self.xml_path)
         logger.info(f"parsing file {filename} with {xml_name}, " f"time of first ping: {timestr}")
 
-    def _split_header(self, raw, header_unpacked):
-        """Splits the header information into a dictionary.
+    def _split_headers(self, raw):
+        """Parses all ping headers in one pass and splits them into a dictionary.
         Modifies self.unpacked_data
 
         Parameters
         ----------
         raw
-            open binary file
-        header_unpacked
-            output of struct unpack of raw file
+            full content of the raw file as bytes
 
         Returns
         -------
-            True or False depending on whether the unpacking was successful
+            number of pings parsed from the file
         """
+        first_header = np.frombuffer(raw, dtype=HEADER_DTYPE, count=1)
         if (
-            header_unpacked[0] != self.FILE_TYPE
+            first_header["profile_flag"][0] != self.FILE_TYPE
         ):  # first field should match hard-coded FILE_TYPE from manufacturer
-            check_eof = raw.read(1)
-            if check_eof:
-                logger.error("Unknown file type")
-                return False
-        header_byte_cnt = 0
-
-        # fields with num_freq data still takes 4 bytes,
-        # the extra bytes contain random numbers
-        firmware_freq_len = 4
-
-        field_w_freq = (
-            "dig_rate",
-            "lockout_index",
-            "num_bins",
-            "range_samples_per_bin",  # fields with num_freq data
-            "data_type",
-            "gain",
-            "pulse_length",
-            "board_num",
-            "frequency",
+            logger.error("Unknown file type")
+            return 0
+
+        # Sampling parameters are constant within a file (enforced in _check_uniqueness),
+        # so the payload size of the first ping fixes the record size for all pings.
+        # Averaged data take 5 bytes per bin (4-byte linear sum + 1-byte overflow),
+        # raw data take 2 bytes per bin.
+        num_chan = int(first_header["num_chan"][0])
+        num_bins = first_header["num_bins"][0][:num_chan].astype(np.int64)
+        data_type = first_header["data_type"][0][:num_chan]
+        self._payload_size = int((num_bins * np.where(data_type, 5, 2)).sum())
+        record_size = self.HEADER_SIZE + self._payload_size
+
+        # The number of pings follows from the file size; one C-level pass
+        # then parses all fixed-layout headers without any EOF probing
+        num_pings, leftover_bytes = divmod(len(raw), record_size)
+        if leftover_bytes:
+            logger.warning(
+                f"{leftover_bytes} trailing bytes do not form a complete "
+                "ping record and were ignored"
+            )
+        record_dtype = np.dtype(HEADER_DTYPE.descr + [("payload", f"V{self._payload_size}")])
+        headers = np.frombuffer(raw, dtype=record_dtype, count=num_pings)
+
+        # Reading stops where the file contains an unexpected flag
+        bad_flag = np.flatnonzero(headers["profile_flag"] != self.FILE_TYPE)
+        if bad_flag.size:
+            logger.error("Unknown file type")
+            num_pings = int(bad_flag[0])
+            headers = headers[:num_pings]
+
+        num_freq = self.parameters["num_freq"]
+        for name, is_freq_field in HEADER_FIELD_PLAN:
+            if is_freq_field:  # fields with num_freq data;
+                # the remaining channel slots contain random numbers
+                self.unpacked_data[name] = headers[name][:, :num_freq].astype(np.int64)
+            else:  # scalar fields and the other longer fields ('ancillary' and 'ad')
+                self.unpacked_data[name] = headers[name].astype(np.int64)
+        return num_pings
+
+    def _add_counts(self, raw, num_pings):
+        """Unpacks the echosounder raw data of all pings.
+        Modifies self.unpacked_data."""
+        # 2-D byte view with one record per row: a column slice keeps the last
+        # axis contiguous, so each channel's payload section decodes for all
+        # pings with a single dtype-reinterpreting view, no per-ping Python work
+        record_size = self.HEADER_SIZE + self._payload_size
+        records = np.frombuffer(raw, dtype=np.uint8, count=num_pings * record_size).reshape(
+            num_pings, record_size
         )
-        for field in HEADER_FIELDS:
-            if field[0] in field_w_freq:  # fields with num_freq data
-                self.unpacked_data[field[0]].append(
-                    header_unpacked[header_byte_cnt : header_byte_cnt + self.parameters["num_freq"]]
-                )
-                header_byte_cnt += firmware_freq_len
-            elif len(field) == 3:  # other longer fields ('ancillary' and 'ad')
-                self.unpacked_data[field[0]].append(
-                    header_unpacked[header_byte_cnt : header_byte_cnt + field[2]]
-                )
-                header_byte_cnt += field[2]
-            else:
-                self.unpacked_data[field[0]].append(header_unpacked[header_byte_cnt])
-                header_byte_cnt += 1
-        return True
-
-    def _add_counts(self, raw, ping_num):
-        """Unpacks the echosounder raw data. Modifies self.unpacked_data."""
-        vv_tmp = [[]] * self.unpacked_data["num_chan"][ping_num]
-        for freq_ch in range(self.unpacked_data["num_chan"][ping_num]):
-            counts_byte_size = self.unpacked_data["num_bins"][ping_num][freq_ch]
-            if self.unpacked_data["data_type"][ping_num][freq_ch]:
-                if self.unpacked_data["avg_pings"][ping_num]:  # if pings are averaged over time
+
+        # Sampling parameters are constant across pings (enforced in
+        # _check_uniqueness), so the first ping fixes the payload layout
+        num_chan = int(self.unpacked_data["num_chan"][0])
+        channel_data = [None] * num_chan
+        byte_cnt = self.HEADER_SIZE
+        for freq_ch in range(num_chan):
+            counts_byte_size = int(self.unpacked_data["num_bins"][0][freq_ch])
+            if self.unpacked_data["data_type"][0][freq_ch]:
+                if self.unpacked_data["avg_pings"][0]:  # if pings are averaged over time
                     divisor = (
-                        self.unpacked_data["ping_per_profile"][ping_num]
-                        * self.unpacked_data["range_samples_per_bin"][ping_num][freq_ch]
+                        self.unpacked_data["ping_per_profile"][0]
+                        * self.unpacked_data["range_samples_per_bin"][0][freq_ch]
                     )
                 else:
-                    divisor = self.unpacked_data["range_samples_per_bin"][ping_num][freq_ch]
-                ls = unpack(
-                    ">" + "I" * counts_byte_size, raw.read(counts_byte_size * 4)
-                )  # Linear sum
-                lso = unpack(
-                    ">" + "B" * counts_byte_size, raw.read(counts_byte_size * 1)
-                )  # linear sum overflow
-                v = (np.array(ls) + np.array(lso) * 4294967295) / divisor
-                v = (np.log10(v) - 2.5) * (8 * 65535) * self.parameters["DS"][freq_ch]
-                v[np.isinf(v)] = 0
-                vv_tmp[freq_ch] = v
+                    divisor = self.unpacked_data["range_samples_per_bin"][0][freq_ch]
+                # Linear sum
+                ls = (
+                    records[:, byte_cnt : byte_cnt + counts_byte_size * 4]
+                    .view(">u4")
+                    .astype(np.uint64)
+                )
+                byte_cnt += counts_byte_size * 4
+                # Linear sum overflow
+                lso = records[:, byte_cnt : byte_cnt + counts_byte_size].astype(np.uint64)
+                byte_cnt += counts_byte_size
+                # combine exactly in 64-bit integers, then cast to float once
+                v = (ls + lso * np.uint64(4294967295)).astype(np.float64) / divisor
+                # empty bins (v == 0) map to 0 instead of -inf,
+                # replacing the old post-hoc isinf scan
+                log_v = np.log10(v, where=v > 0, out=np.zeros_like(v))
+                v = np.where(
+                    v > 0, (log_v - 2.5) * (8 * 65535) * self.parameters["DS"][freq_ch], 0.0
+                )
+                channel_data[freq_ch] = v
             else:
-                counts_chunk = raw.read(counts_byte_size * 2)
-                counts_unpacked = unpack(">" + "H" * counts_byte_size, counts_chunk)
-                vv_tmp[freq_ch] = counts_unpacked
-        self.unpacked_data["counts"].append(vv_tmp)
+                channel_data[freq_ch] = records[:, byte_cnt : byte_cnt + counts_byte_size * 2].view(
+                    ">u2"
+                )
+                byte_cnt += counts_byte_size * 2
+
+        # preallocated [ping, channel] object array holding per-channel row
+        # views; counts[ping_num][freq_ch] indexing stays valid downstream
+        # while channels may differ in bin count and dtype
+        counts = np.empty((num_pings, num_chan), dtype=object)
+        for freq_ch in range(num_chan):
+            counts[:, freq_ch] = list(channel_data[freq_ch])
+        self.unpacked_data["counts"] = counts
 
     def _check_uniqueness(self):
         """Check for ping-by-ping consistency of sampling parameters and reduce if identical."""
         if not self.unpacked_data:
             self.parse_raw()
 
-        if np.array(self.unpacked_data["profile_flag"]).size != 1:  # Only check uniqueness once.
-            # fields with num_freq data
-            field_w_freq = (
-                "dig_rate",
-                "lockout_index",
-                "num_bins",
-                "range_samples_per_bin",
-                "data_type",
-                "gain",
-                "pulse_length",
-                "board_num",
-                "frequency",
-            )
+        if np.asarray(self.unpacked_data["profile_flag"]).size != 1:  # Only check uniqueness once.
             # fields to reduce size if the same for all pings
             field_include = (
                 "profile_flag",
@@ -438,16 +487,18 @@ class ParseAZFP(ParseBase):
                 "num_chan",
                 "spare_chan",
             )
-            for field in field_w_freq:
-                uniq = np.unique(self.unpacked_data[field], axis=0)
-                if uniq.shape[0] == 1:
-                    self.unpacked_data[field] = uniq.squeeze()
+            # Equality against the first ping is a single O(N) comparison,
+            # without the sort np.unique would do over all pings
+            for field in FIELD_W_FREQ:
+                vals = self.unpacked_data[field]
+                if (vals == vals[0]).all():
+                    self.unpacked_data[field] = vals[0].squeeze()
                 else:
                     raise ValueError(f"Header value {field} is not constant for each ping")
             for field in field_include:
-                uniq = np.unique(self.unpacked_data[field])
-                if uniq.shape[0] == 1:
-                    self.unpacked_data[field] = uniq.squeeze()
+                vals = self.unpacked_data[field]
+                if (vals == vals[0]).all():
+                    self.unpacked_data[field] = vals[0]
                 else:
                     raise ValueError(f"Header value {field} is not constant for each ping")
 
@@ -457,43 +508,62 @@ class ParseAZFP(ParseBase):
         if not self.unpacked_data:
             self.parse_raw()
 
-        ping_time = []
-        for ping_num, year in enumerate(self.unpacked_data["year"]):
-            ping_time.append(
-                np.datetime64(
-                    dt(
-                        year,
-                        self.unpacked_data["month"][ping_num],
-                        self.unpacked_data["day"][ping_num],
-                        self.unpacked_data["hour"][ping_num],
-                        self.unpacked_data["minute"][ping_num],
-                        int(
-                            self.unpacked_data["second"][ping_num]
-                            + self.unpacked_data["hundredths"][ping_num] / 100
-                        ),
-                    ).replace(tzinfo=None),
-                    "[ms]",
-                )
-            )
-        self.ping_time = ping_time
+        ud = self.unpacked_data
+        # Assemble a datetime64[ms] array directly from the parsed date/time
+        # columns, without constructing a Python datetime per ping.
+        # Calendar units (year, month) are converted to days before the
+        # absolute time-of-day offsets are added.
+        date = (
+            (ud["year"] - 1970).astype("datetime64[Y]")
+            + (ud["month"] - 1).astype("timedelta64[M]")
+        ).astype("datetime64[D]") + (ud["day"] - 1).astype("timedelta64[D]")
+        time_of_day = (
+            ud["hour"].astype("timedelta64[h]")
+            + ud["minute"].astype("timedelta64[m]")
+            + ud["second"].astype("timedelta64[s]")
+            + (ud["hundredths"] * 10).astype("timedelta64[ms]")
+        )
+        self.ping_time = (date + time_of_day).astype("datetime64[ms]")
 
     @staticmethod
     def _calc_Sv_offset(f, pulse_length):
         """Calculate the compensation factor for Sv calculation."""
         # TODO: this method seems should be in echopype.process
         if f > 38000:
-            if pulse_length == 300:
-                return 1.1
-            elif pulse_length == 500:
-                return 0.8
-            elif pulse_length == 700:
-                return 0.5
-            elif pulse_length == 900:
-                return 0.3
-            elif pulse_length == 1000:
-                return 0.3
+            return ParseAZFP.SV_OFFSET_HIGH_FREQ.get(pulse_length)
         else:
-            if pulse_length == 500:
-                return 1.1
-            elif pulse_length == 1000:
-                return 0.7
+            return ParseAZFP.SV_OFFSET_LOW_FREQ.get(pulse_length)
+
+
+def _parse_one(file, xml_path, storage_options):
+    """Parse a single AZFP raw file; used as the parse_many worker."""
+    parser = ParseAZFP(file, params=xml_path, storage_options=storage_options)
+    parser.parse_raw()
+    return parser
+
+
+def parse_many(files, xml_path, storage_options={}, n_workers=None):
+    """Parse multiple AZFP raw files in parallel, one worker process per file.
+
+    Files are independent of each other, so conversion of a deployment's
+    worth of .01A files scales with the number of cores.
+
+    Parameters
+    ----------
+    files : list of str
+        paths to .01A raw files
+    xml_path : str
+        path to the XML parameter file shared by the raw files
+    storage_options : dict
+        options for cloud storage
+    n_workers : int, optional
+        number of worker processes; defaults to the number of processors
+
+    Returns
+    -------
+    list of ParseAZFP
+        parsed objects, in the same order as ``files``
+    """
+    worker = partial(_parse_one, xml_path=xml_path, storage_options=storage_options)
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(worker, files))